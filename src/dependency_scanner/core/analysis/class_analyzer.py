@@ -48,8 +48,7 @@ class ClassAnalyzer:
                 # Write valid classes
                 f.write("[+] Valid Classes\n")
                 f.write("-" * 50 + "\n")
-                for class_name in sorted(class_sets["valid"]):
-                    f.write(f"{class_name}\n")
+                f.writelines(f"{class_name}\n" for class_name in sorted(class_sets["valid"]))
                     
                 f.write(f"\nTotal Valid: {len(class_sets['valid'])}\n\n")
                 
@@ -60,8 +59,8 @@ class ClassAnalyzer:
                     f.write(f"{class_name}\n")
                     if class_name in self._class_suggestions:
                         f.write("  Suggested replacements:\n")
-                        for suggestion, score in self._class_suggestions[class_name]:
-                            f.write(f"  └─ {suggestion} ({score:.2f})\n")
+                        f.writelines(f"  └─ {suggestion} ({score:.2f})\n"
+                                     for suggestion, score in self._class_suggestions[class_name])
                     
                 f.write(f"\nTotal Missing: {len(class_sets['missing'])}\n")
                 
@@ -70,8 +69,9 @@ class ClassAnalyzer:
     
     def _find_suggestions_for_classes(self, missing_classes: Set[str], valid_classes: Set[str]) -> None:
         """Find suggestions for missing classes only once."""
-        for missing_class in missing_classes:
-            suggestions = self.fuzzy_matcher.find_similar_classes(missing_class, valid_classes)
+        # One batch call prepares the valid classes once for every missing class
+        batch_results = self.fuzzy_matcher.find_similar_classes_batch(list(missing_classes), valid_classes)
+        for missing_class, suggestions in batch_results.items():
             if suggestions:
                 self._class_suggestions[missing_class] = suggestions
                 
@@ -11,6 +11,7 @@ class FuzzyMatchConfig:
     cache_size: int = 1024
     max_suggestions: int = 3  # Add missing config parameter
     high_confidence_threshold: float = 0.9  # Add threshold for high confidence matches
+    max_suggestions_total: int = 500  # Cap on missing classes searched per mission
     
     categories: Dict[str, Set[str]] = field(default_factory=lambda: {
         'helmet': {'helmet', 'hat', 'cap', 'boonie', 'cover'},
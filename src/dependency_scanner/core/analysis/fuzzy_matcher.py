@@ -1,6 +1,5 @@
-from typing import Set, List, Dict, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import os
+from typing import Callable, FrozenSet, Iterable, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 import re
 from difflib import SequenceMatcher
 from functools import lru_cache
@@ -9,16 +8,58 @@ import logging
 from .fuzzy_config import FuzzyMatchConfig
 from .fuzzy_result import FuzzyMatchResult
 
+# rapidfuzz scores the true longest common subsequence, difflib's matching blocks can
+# find less, so a few borderline suggestions depend on which backend is installed
+rapidfuzz_ratio: Optional[Callable[..., float]]
+try:
+    from rapidfuzz.fuzz import ratio as rapidfuzz_ratio  # type: ignore[no-redef]
+except ImportError:  # Optional, falls back to difflib
+    rapidfuzz_ratio = None
+
 logger = logging.getLogger(__name__)
 
+# Cutoffs derived from the threshold round in floating point, relax them by this much so
+# pruning never drops a candidate whose final score lands exactly on the threshold
+_CUTOFF_EPSILON = 1e-9
+
+def _sequence_ratio(a: str, b: str, cutoff: float = 0.0) -> float:
+    """Similarity of two strings in [0, 1], or 0.0 once it is known to fall below cutoff."""
+    if rapidfuzz_ratio is not None:
+        return rapidfuzz_ratio(a, b, score_cutoff=cutoff * 100.0) / 100.0
+    matcher = SequenceMatcher(None, a, b)
+    # Cheap upper bounds first, the full ratio is the expensive part
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
+
+@dataclass(slots=True, frozen=True)
+class _Candidate:
+    """Query-independent data for one candidate class name."""
+    name: str
+    normalized: str
+    length: int
+    parts: FrozenSet[str]
+    normalized_parts: FrozenSet[str]
+    category: Optional[str]
+
+@dataclass(slots=True)
+class _CandidateIndex:
+    """Prepared candidates, plus memoized results when the candidate set is immutable."""
+    candidates: List[_Candidate]
+    results: Optional[Dict[Tuple[str, int], FuzzyMatchResult]] = None
+    # Candidates compatible with a query category, in original order, built on first use
+    by_category: Dict[str, List[_Candidate]] = field(default_factory=dict)
+
 class FuzzyClassMatcher:
     """Enhanced fuzzy matching for class names."""
     
     def __init__(self, config: Optional[FuzzyMatchConfig] = None):
         self.config = config or FuzzyMatchConfig()
         self._reverse_substitutions = self._build_reverse_substitutions()
+        self._substitution_alternatives = self._build_substitution_alternatives()
         self._compile_patterns()
-        self.max_workers = min(32, (os.cpu_count() or 1) + 4)
+        # Index of the last frozenset seen, reused while it stays the same object
+        self._candidate_index: Optional[Tuple[FrozenSet[str], _CandidateIndex]] = None
         
     def _compile_patterns(self) -> None:
         """Compile regex patterns once at initialization."""
@@ -37,24 +78,57 @@ class FuzzyClassMatcher:
                 reverse[sub] = base_word
         return reverse
 
+    def _build_substitution_alternatives(self) -> Dict[str, FrozenSet[str]]:
+        """Build the words that count as a substitution match for each word, in both directions."""
+        alternatives: Dict[str, set] = {}
+        for base_word, substitutes in self.config.word_substitutions.items():
+            alternatives.setdefault(base_word, set()).update(substitutes)
+        for sub, base_word in self._reverse_substitutions.items():
+            alternatives.setdefault(sub, set()).add(base_word)
+        return {word: frozenset(words) for word, words in alternatives.items()}
+
     @lru_cache(maxsize=1024)
     def normalize_class_name(self, class_name: str) -> str:
         """Normalize class name for comparison with caching."""
+        return self._normalize(class_name)
+
+    def _normalize(self, class_name: str) -> str:
+        """Uncached normalization, used for bulk candidate preparation."""
         normalized = class_name.lower()
         normalized = self._patterns['prefix'].sub('', normalized)
         normalized = self._patterns['number'].sub('', normalized)
         normalized = self._patterns['underscore'].sub('_', normalized)
         return normalized.strip('_')
 
-    def find_similar_classes(self, query: str, candidates: Set[str], 
+    def find_similar_classes(self, query: str, candidates: Iterable[str], 
                            max_suggestions: int = 3) -> FuzzyMatchResult:
         """Find similar class names with detailed matching information."""
+        return self._match(query, self._prepare_candidates(candidates), max_suggestions)
+
+    def _match(self, query: str, index: _CandidateIndex,
+               max_suggestions: int) -> FuzzyMatchResult:
+        """Match one query against prepared candidates, reusing an earlier result if possible."""
+        if index.results is None:
+            return self._match_uncached(query, index, max_suggestions)
+            
+        key = (query, max_suggestions)
+        result = index.results.get(key)
+        if result is None:
+            result = self._match_uncached(query, index, max_suggestions)
+            if len(index.results) >= self.config.cache_size:
+                index.results.clear()
+            index.results[key] = result
+        return result
+
+    def _match_uncached(self, query: str, index: _CandidateIndex,
+                        max_suggestions: int) -> FuzzyMatchResult:
+        """Match one query against prepared candidates."""
         normalized_query = self.normalize_class_name(query)
-        query_parts = set(self._patterns['splitter'].split(query.lower()))
-        category = self._detect_category(query)
+        query_parts = self._split_parts(query)
+        category = self._category_for_parts(query_parts)
         
         # Quick exact/substitution matches
-        direct_matches = self._find_direct_matches(normalized_query, candidates)
+        direct_matches = self._find_direct_matches(normalized_query, index.candidates)
         if direct_matches:
             return FuzzyMatchResult(
                 original=query,
@@ -65,11 +139,13 @@ class FuzzyClassMatcher:
             )
             
         # Filtered candidate search
-        filtered_candidates = self._filter_candidates(query, category, query_parts, candidates)
+        filtered_candidates = self._filter_candidates(
+            query, query_parts, self._candidates_for_category(index, category)
+        )
         
         # Detailed scoring
         scored_matches = self._score_candidates(
-            normalized_query, query, filtered_candidates
+            normalized_query, query_parts, filtered_candidates
         )
         
         return FuzzyMatchResult(
@@ -81,55 +157,23 @@ class FuzzyClassMatcher:
         )
 
     def find_similar_classes_batch(self, queries: List[str], 
-                                 candidates: Set[str],
+                                 candidates: Iterable[str],
                                  max_suggestions: int = 3) -> Dict[str, FuzzyMatchResult]:
-        """Process multiple queries in parallel."""
-        # Initialize results dict with empty results for all queries
-        results = {
-            query: FuzzyMatchResult(
-                original=query,
-                matches=[],
-                normalized_form=self.normalize_class_name(query)
-            ) for query in queries
-        }
-        
-        candidates = set(candidates)  # Ensure we have a set
-        
-        # Process queries in batches
-        if len(queries) > 100:
-            chunk_size = max(100, len(queries) // self.max_workers)
-            chunks = [queries[i:i + chunk_size] 
-                     for i in range(0, len(queries), chunk_size)]
-            
-            # Process chunks in parallel
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_chunk = {
-                    executor.submit(self._process_batch_chunk, chunk, candidates, max_suggestions): chunk
-                    for chunk in chunks
-                }
-                
-                for future in as_completed(future_to_chunk):
-                    try:
-                        chunk_results = future.result()
-                        results.update(chunk_results)  # Update with any found matches
-                    except Exception as e:
-                        logger.error(f"Error processing chunk: {e}")
-        else:
-            # Process sequentially for small inputs
-            for query in queries:
-                # Update existing result entry
-                results[query] = self.find_similar_classes(query, candidates, max_suggestions)
-                    
-        return results
+        """Process multiple queries against one shared candidate preparation.
+
+        Matching is pure Python and holds the GIL, so queries run sequentially.
+        """
+        prepared = self._prepare_candidates(candidates)
+        return self._process_batch_chunk(queries, prepared, max_suggestions)
 
-    def _process_batch_chunk(self, chunk: List[str], candidates: Set[str],
+    def _process_batch_chunk(self, chunk: List[str], candidates: _CandidateIndex,
                            max_suggestions: int) -> Dict[str, FuzzyMatchResult]:
         """Process a chunk of queries."""
         results = {}
         for query in chunk:
             try:
                 # Always store result regardless of matches
-                results[query] = self.find_similar_classes(query, candidates, max_suggestions)
+                results[query] = self._match(query, candidates, max_suggestions)
             except Exception as e:
                 logger.error(f"Error processing {query}: {e}")
                 # Return empty result on error
@@ -140,93 +184,155 @@ class FuzzyClassMatcher:
                 )
         return results
 
+    def _prepare_candidates(self, candidates: Iterable[str]) -> _CandidateIndex:
+        """Normalize, split and categorize candidates once so every query can share the work."""
+        # Only a frozenset is safe to reuse by identity, a set could change in place
+        if not isinstance(candidates, frozenset):
+            return _CandidateIndex([self._prepare_candidate(name) for name in candidates])
+            
+        cached = self._candidate_index
+        if cached is not None and cached[0] is candidates:
+            return cached[1]
+            
+        # Consecutive sets mostly share names (the same game content with another
+        # task layered on), so prepared candidates of the previous set are reused
+        previous = {c.name: c for c in cached[1].candidates} if cached is not None else {}
+        prepared = []
+        for name in candidates:
+            candidate = previous.get(name)
+            prepared.append(candidate if candidate is not None else self._prepare_candidate(name))
+            
+        # Results only stay valid for this exact candidate set, so they live on its index
+        index = _CandidateIndex(prepared, results={})
+        self._candidate_index = (candidates, index)
+        return index
+
+    def _prepare_candidate(self, name: str) -> _Candidate:
+        """Precompute the query-independent data of one candidate name."""
+        normalized = self._normalize(name)
+        parts = self._split_parts(name)
+        return _Candidate(
+            name=name,
+            normalized=normalized,
+            length=len(normalized),
+            parts=parts,
+            normalized_parts=self._split_parts(normalized),
+            category=self._category_for_parts(parts)
+        )
+
+    def _split_parts(self, class_name: str) -> FrozenSet[str]:
+        """Split a class name into its lowercase words."""
+        return frozenset(self._patterns['splitter'].split(class_name.lower()))
+
     def _detect_category(self, class_name: str) -> Optional[str]:
         """Detect the category of a class name."""
-        parts = set(self._patterns['splitter'].split(class_name.lower()))
-        
+        return self._category_for_parts(self._split_parts(class_name))
+
+    def _category_for_parts(self, parts: FrozenSet[str]) -> Optional[str]:
+        """Detect the category from already split class name words."""
         for category, keywords in self.config.categories.items():
             if keywords & parts:
                 return category
         return None
 
-    def _find_direct_matches(self, normalized_query: str, candidates: Set[str]) -> List[Tuple[str, float]]:
+    def _find_direct_matches(self, normalized_query: str,
+                             candidates: List[_Candidate]) -> List[Tuple[str, float]]:
         """Find direct matches or substitution matches."""
         matches = []
+        normalized_query_parts = self._split_parts(normalized_query)
         for candidate in candidates:
-            normalized_candidate = self.normalize_class_name(candidate)
-            if normalized_candidate == normalized_query:
-                matches.append((candidate, 1.0))
-            elif self._calculate_substitution_score(normalized_query, normalized_candidate) > 0.8:
-                matches.append((candidate, 0.8))
+            if candidate.normalized == normalized_query:
+                matches.append((candidate.name, 1.0))
+            elif self._substitution_score_parts(normalized_query_parts, candidate.normalized_parts) > 0.8:
+                matches.append((candidate.name, 0.8))
         return matches
 
-    def _filter_candidates(self, query: str, category: Optional[str],
-                         query_parts: Set[str], candidates: Set[str]) -> Set[str]:
-        """Filter candidates based on quick checks."""
-        filtered = set()
+    def _candidates_for_category(self, index: _CandidateIndex,
+                                 category: Optional[str]) -> List[_Candidate]:
+        """Candidates without a conflicting category, so filtering never visits the others."""
+        if not category:
+            return index.candidates
+            
+        compatible = index.by_category.get(category)
+        if compatible is None:
+            compatible = [c for c in index.candidates
+                          if not c.category or c.category == category]
+            index.by_category[category] = compatible
+        return compatible
+
+    def _filter_candidates(self, query: str, query_parts: FrozenSet[str],
+                         candidates: List[_Candidate]) -> List[_Candidate]:
+        """Filter category-compatible candidates based on quick checks."""
+        filtered = []
         
         for candidate in candidates:
             # Skip exact matches and empty strings
-            if not candidate or candidate == query:
+            if not candidate.name or candidate.name == query:
                 continue
-                
-            # Category check
-            if category:
-                candidate_category = self._detect_category(candidate)
-                if candidate_category and candidate_category != category:
-                    continue
             
             # Word overlap check
-            candidate_parts = set(self._patterns['splitter'].split(candidate.lower()))
-            if query_parts & candidate_parts:
-                filtered.add(candidate)
+            if query_parts & candidate.parts:
+                filtered.append(candidate)
                 
         return filtered
 
-    def _score_candidates(self, normalized_query: str, query: str,
-                        candidates: Set[str]) -> List[Tuple[str, float]]:
+    def _score_candidates(self, normalized_query: str, query_parts: FrozenSet[str],
+                        candidates: List[_Candidate]) -> List[Tuple[str, float]]:
         """Score candidates based on similarity."""
         matches = []
+        query_length = len(normalized_query)
+        # Config values and bound methods are read once, not per candidate
+        threshold = self.config.similarity_threshold
+        max_suggestions = self.config.max_suggestions
+        substitution_score = self._substitution_score_parts
+        similarity_score = self._calculate_similarity_score
         for candidate in candidates:
-            score = self._calculate_similarity_score(
+            # Word substitution bonus is cheap, work out what the base score still needs
+            sub_score = substitution_score(query_parts, candidate.parts)
+            needed = (threshold - sub_score * 0.3) / 0.7 - _CUTOFF_EPSILON
+            
+            # The sequence ratio can't exceed 2*min(len)/(len+len), skip hopeless lengths
+            total_length = query_length + candidate.length
+            if needed > 0 and total_length and 2 * min(query_length, candidate.length) / total_length < needed:
+                continue
+                
+            score = similarity_score(
                 normalized_query,
-                query,
-                candidate
+                sub_score,
+                candidate,
+                needed
             )
             
-            if score >= self.config.similarity_threshold:
-                matches.append((candidate, score))
+            if score >= threshold:
+                matches.append((candidate.name, score))
                 
                 # Early exit on high confidence
-                if len(matches) >= self.config.max_suggestions and all(m[1] > 0.9 for m in matches):
+                if len(matches) >= max_suggestions and all(m[1] > 0.9 for m in matches):
                     break
 
-        return sorted(matches, key=lambda x: x[1], reverse=True)[:self.config.max_suggestions]
+        return sorted(matches, key=lambda x: x[1], reverse=True)[:max_suggestions]
 
-    def _calculate_similarity_score(self, normalized_query: str, query: str,
-                                 candidate: str) -> float:
-        """Calculate final similarity score."""
-        candidate_norm = self.normalize_class_name(candidate)
-        
+    def _calculate_similarity_score(self, normalized_query: str, sub_score: float,
+                                 candidate: _Candidate, cutoff: float = 0.0) -> float:
+        """Calculate final similarity score, base scores under cutoff count as 0."""
         # Base similarity using sequence matcher
-        base_score = SequenceMatcher(None, normalized_query, candidate_norm).ratio()
-        
-        # Word substitution bonus
-        sub_score = self._calculate_substitution_score(query, candidate)
+        base_score = _sequence_ratio(normalized_query, candidate.normalized, cutoff)
         
         # Weighted combination
         return (base_score * 0.7) + (sub_score * 0.3)
 
     def _calculate_substitution_score(self, original: str, candidate: str) -> float:
         """Calculate word substitution similarity score."""
-        original_parts = set(self._patterns['splitter'].split(original.lower()))
-        candidate_parts = set(self._patterns['splitter'].split(candidate.lower()))
-        
+        return self._substitution_score_parts(self._split_parts(original), self._split_parts(candidate))
+
+    def _substitution_score_parts(self, original_parts: FrozenSet[str],
+                                  candidate_parts: FrozenSet[str]) -> float:
+        """Calculate word substitution similarity from already split names."""
+        # Substitutes and base words are looked up together, one C-level disjoint check per part
+        alternatives = self._substitution_alternatives
         score = sum(
             1.0 if part in candidate_parts else
-            0.8 if any(sub in candidate_parts 
-                      for sub in self.config.word_substitutions.get(part, set())) or
-                 self._reverse_substitutions.get(part) in candidate_parts
+            0.8 if part in alternatives and not alternatives[part].isdisjoint(candidate_parts)
             else 0.0
             for part in original_parts
         )
@@ -238,7 +344,7 @@ class FuzzyClassMatcher:
         return self._detect_category(class_name)
 
     def _find_similar_classes_sequential(self, query: str, 
-                                      candidates: Set[str],
+                                      candidates: Iterable[str],
                                       max_suggestions: int) -> List[Tuple[str, float]]:
         """Sequential processing for testing comparison."""
         result = self.find_similar_classes(query, candidates, max_suggestions)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class FuzzyMatchResult:
     """Results from fuzzy matching operation."""
     original: str
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 from dependency_scanner.core.analysis.fuzzy_matcher import FuzzyClassMatcher
 from dependency_scanner.core.analysis.fuzzy_config import FuzzyMatchConfig
+from dependency_scanner.core.utils.serialization import dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -58,12 +59,10 @@ class SuggestionGenerator:
         """Write suggestions to a separate report file."""
         try:
             report_path = report_dir / f"{task_name}_suggestions.json"
-            with report_path.open('w') as f:
-                import json
-                json.dump({
-                    'suggestions': suggestions.suggestions,
-                    'categories': suggestions.categories
-                }, f, indent=2)
+            dump_json({
+                'suggestions': suggestions.suggestions,
+                'categories': suggestions.categories
+            }, report_path, indent=True)
                 
             logger.info(f"Wrote suggestion report to {report_path}")
             
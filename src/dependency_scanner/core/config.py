@@ -1,10 +1,10 @@
 import argparse
-import json
 from pathlib import Path
 from typing import Tuple, Dict, List, Union, Any, TypeVar, cast, Optional, overload
 import logging
 
 from dependency_scanner.core.types import ScanTask
+from dependency_scanner.core.utils.serialization import load_json
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +38,10 @@ def _convert_to_path(value: Union[str, List[str], Path]) -> Union[Path, List[Pat
 def load_config(config_path: Path, cli_args: argparse.Namespace) -> Tuple[Dict[str, Path], List[ScanTask], List[Path]]:
     """Load and merge configuration."""
     try:
-        config = json.loads(config_path.read_text()) if config_path.exists() else {}
+        # A missing file is the common case, let the open report it instead of stat-ing first
+        config = load_json(config_path)
+    except FileNotFoundError:
+        config = {}
     except Exception as e:
         logger.warning(f"Failed to load config file: {e}")
         config = {}
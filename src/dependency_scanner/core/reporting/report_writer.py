@@ -1,10 +1,11 @@
 from pathlib import Path
 from typing import Dict, Optional
 import logging
-import json
 from datetime import datetime
 
 from dependency_scanner.core.types import ValidationResult
+from dependency_scanner.core.utils.serialization import dump_json
+from dependency_scanner.core.utils.fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +14,7 @@ class ReportWriter:
     
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.output_dir)
         
     def write_report(self, 
                     task_name: str,
@@ -58,19 +59,16 @@ class ReportWriter:
                     
                     if result.missing_classes:
                         f.write("  Missing Classes:\n")
-                        for cls in sorted(result.missing_classes):
-                            f.write(f"  └─ {cls}\n")
+                        f.writelines(f"  └─ {cls}\n" for cls in sorted(result.missing_classes))
                                                         
                     if result.missing_assets:
                         f.write("  Missing Assets:\n")
-                        for asset in sorted(result.missing_assets):
-                            f.write(f"  └─ {asset}\n")
+                        f.writelines(f"  └─ {asset}\n" for asset in sorted(result.missing_assets))
                     f.write("\n")
             
             f.write(f"\n[+] COMPLIANT MISSIONS ({len(compliant)})\n")
             f.write("-" * 50 + "\n")
-            for mission_path in sorted(compliant):
-                f.write(f"{mission_path.name}\n")
+            f.writelines(f"{mission_path.name}\n" for mission_path in sorted(compliant))
             
             total = len(results)
             f.write("\n")
@@ -96,4 +94,4 @@ class ReportWriter:
             for mission_path, result in results.items()
         }
         
-        path.write_text(json.dumps(json_data, indent=2))
+        dump_json(json_data, path, indent=True)
@@ -1,7 +1,9 @@
 from pathlib import Path
 from typing import Dict, Optional
+from concurrent.futures import Executor
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 
 from class_scanner.models import ClassData
 from asset_scanner import Asset
@@ -16,12 +18,18 @@ class ContentScanResult:
     classes: Dict[str, ClassData]
     assets: Dict[str, Asset]
 
+    @cached_property
+    def classes_lower(self) -> Dict[str, str]:
+        """Lowercase -> original class name map, built once and shared by every task."""
+        return {k.lower(): k for k in self.classes}
+
 class ContentScanner:
     """Handles scanning of game and mod content."""
     
-    def __init__(self, cache_dir: Path, max_workers: int = 16):
+    def __init__(self, cache_dir: Path, max_workers: int = 16, executor: Optional[Executor] = None):
         self.cache_dir = cache_dir
         self.max_workers = max_workers
+        self._executor = executor
         self._handler: Optional[GameDataHandler] = None
         
     def scan_content(self, task: ScanTask, is_mod_folder: bool = False) -> Optional[ContentScanResult]:
@@ -30,7 +38,8 @@ class ContentScanner:
             # Create fresh handler for each scan operation
             self._handler = GameDataHandler(
                 self.cache_dir / task.name,
-                self.max_workers
+                self.max_workers,
+                self._executor
             )
             
             content = None
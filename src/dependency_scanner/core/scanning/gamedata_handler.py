@@ -1,15 +1,18 @@
 from pathlib import Path
 from typing import Dict, Optional, Any, List, Set, Tuple
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, as_completed
 from dataclasses import dataclass
-import hashlib
+import os
 
 from class_scanner.api import ClassAPI
 from class_scanner.models import ClassData
 from asset_scanner import AssetAPI, Asset
 from asset_scanner.config import APIConfig
 
+from dependency_scanner.core.utils.fs import ensure_dir, new_folder_hasher, walk_files
+from dependency_scanner.core.utils.pool import get_shared_io_executor
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -20,26 +23,41 @@ class ScanStats:
     asset_count: int = 0
     failed_pbos: int = 0
 
+def _merge_dicts(dicts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge dicts in order, later entries take precedence."""
+    if not dicts:
+        return {}
+    merged = dict(dicts[0])
+    for d in dicts[1:]:
+        merged.update(d)
+    return merged
+
 class GameDataHandler:
     """Handles mod content scanning operations."""
     
-    def __init__(self, cache_dir: Path, max_workers: int = 16):
+    def __init__(self, cache_dir: Path, max_workers: int = 16, executor: Optional[Executor] = None):
         self.cache_dir = cache_dir
         self.max_workers = max_workers
+        self._executor = executor or get_shared_io_executor(max_workers)
         
         # Create cache directories
         self.class_cache_dir = cache_dir / "classes"
         self.asset_cache_dir = cache_dir / "assets"
-        self.class_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.asset_cache_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.class_cache_dir)
+        ensure_dir(self.asset_cache_dir)
         
     def scan_game_content(self, game_path: Path) -> Optional[Dict[str, Any]]:
         """Scan content from a game directory."""
 
         # Generate cache paths using @folder name
-        class_cache, asset_cache = self._get_cache_paths(game_path)
-        
-        cached_content = self._load_from_cache(class_cache, asset_cache, game_path)
+        cache_paths = self._get_cache_paths(game_path)
+        if cache_paths is None:
+            # No stable key, scan without reading or writing a cache
+            logger.warning(f"No content hash for {game_path.name}, scanning without cache")
+            class_cache, asset_cache, cached_content = None, None, None
+        else:
+            class_cache, asset_cache = cache_paths
+            cached_content = self._load_from_cache(class_cache, asset_cache, game_path)
         # Print cache paths for debugging
         logger.info(f"Class cache: {class_cache}")
         logger.info(f"Asset cache: {asset_cache}")
@@ -67,8 +85,9 @@ class GameDataHandler:
     def scan_mod_content(self, mod_paths: List[Path]) -> Optional[Dict[str, Any]]:
         """Scan mod content and return combined results."""
         try:
-            combined_classes = {}
-            combined_assets = {}
+            # Collect per-folder results and merge once at the end
+            class_dicts: List[Dict[str, ClassData]] = []
+            asset_dicts: List[Dict[str, Asset]] = []
             
             for mod_path in mod_paths:
                 if not mod_path.exists():
@@ -83,29 +102,34 @@ class GameDataHandler:
 
                 for folder in mod_folders:
                     # Generate cache paths using @folder name
-                    class_cache, asset_cache = self._get_cache_paths(folder)
+                    cache_paths = self._get_cache_paths(folder)
+                    if cache_paths is None:
+                        # No stable key, scan without reading or writing a cache
+                        logger.warning(f"No content hash for {folder.name}, scanning without cache")
+                        class_cache, asset_cache, cached_content = None, None, None
+                    else:
+                        class_cache, asset_cache = cache_paths
+                        cached_content = self._load_from_cache(class_cache, asset_cache, folder)
                     
                     logger.info(f"Class cache: {class_cache}")
                     logger.info(f"Asset cache: {asset_cache}")
                     
-                    cached_content = self._load_from_cache(class_cache, asset_cache, folder)
-                    
                     if cached_content:
                         logger.info(f"Using cached content for {folder.name}")
                         classes, assets = cached_content
-                        combined_classes.update(classes)
-                        combined_assets.update(assets)
+                        class_dicts.append(classes)
+                        asset_dicts.append(assets)
                         continue
                     
                     logger.info(f"Starting parallel scan of {folder.name}")
                     scan_results = self._parallel_scan_mod(folder, class_cache, asset_cache)
                     if scan_results:
-                        combined_classes.update(scan_results.get('classes', {}))
-                        combined_assets.update(scan_results.get('assets', {}))
+                        class_dicts.append(scan_results.get('classes', {}))
+                        asset_dicts.append(scan_results.get('assets', {}))
                 
             return {
-                'classes': combined_classes,
-                'assets': combined_assets
+                'classes': _merge_dicts(class_dicts),
+                'assets': _merge_dicts(asset_dicts)
             }
             
         except Exception as e:
@@ -114,9 +138,9 @@ class GameDataHandler:
 
     def _parallel_scan_mod(self, 
                           mod_path: Path, 
-                          class_cache: Path,
-                          asset_cache: Path) -> Optional[Dict[str, Any]]:
-        """Perform parallel scanning of a mod directory."""
+                          class_cache: Optional[Path],
+                          asset_cache: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Perform parallel scanning of a mod directory, without caching when no cache paths are given."""
         try:
             # Initialize scanners with direct cache files
             class_scanner = ClassAPI(cache_file=class_cache)
@@ -135,33 +159,34 @@ class GameDataHandler:
             stats = ScanStats()
             classes: Dict[str, ClassData] = {}
             
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_pbo = {
-                    executor.submit(self._scan_pbo_for_classes, pbo, class_scanner): pbo
-                    for pbo in pbo_files
-                }
-                
-                # Process results as they complete
-                for future in as_completed(future_to_pbo):
-                    pbo = future_to_pbo[future]
-                    try:
-                        if result := future.result():
-                            stats.pbo_count += 1
-                            stats.class_count += len(result)
-                            classes.update(result)
-                            logger.debug(f"Processed PBO: {pbo.name} - Found {len(result)} classes")
-                        else:
-                            stats.failed_pbos += 1
-                            logger.warning(f"Failed to process PBO: {pbo.name}")
-                    except Exception as e:
+            future_to_pbo = {
+                self._executor.submit(self._scan_pbo_for_classes, pbo, class_scanner): pbo
+                for pbo in pbo_files
+            }
+            
+            # Process results as they complete
+            for future in as_completed(future_to_pbo):
+                pbo = future_to_pbo[future]
+                try:
+                    if result := future.result():
+                        stats.pbo_count += 1
+                        stats.class_count += len(result)
+                        classes.update(result)
+                        logger.debug(f"Processed PBO: {pbo.name} - Found {len(result)} classes")
+                    else:
                         stats.failed_pbos += 1
-                        logger.error(f"Error processing PBO {pbo}: {e}")
+                        logger.warning(f"Failed to process PBO: {pbo.name}")
+                except Exception as e:
+                    stats.failed_pbos += 1
+                    logger.error(f"Error processing PBO {pbo}: {e}")
             
             # Save class cache after scanning
-            class_scanner.save_cache()
+            use_cache = class_cache is not None and asset_cache is not None
+            if use_cache:
+                class_scanner.save_cache()
             
             # Scan for assets
-            assets = self._scan_folder_for_assets(mod_path, asset_scanner)
+            assets = self._scan_folder_for_assets(mod_path, asset_scanner, save_cache=use_cache)
             stats.asset_count = len(assets)
             
             # Log final statistics
@@ -188,11 +213,13 @@ class GameDataHandler:
             logger.error(f"Failed to scan PBO {pbo_path}: {e}")
         return None
 
-    def _scan_folder_for_assets(self, mod_path: Path, scanner: AssetAPI) -> Set[Asset]:
+    def _scan_folder_for_assets(self, mod_path: Path, scanner: AssetAPI,
+                                save_cache: bool = True) -> Set[Asset]:
         """Scan for assets in mod directory."""
         try:
             if result := scanner.scan(mod_path):
-                scanner.save_cache()
+                if save_cache:
+                    scanner.save_cache()
                 return result.assets
         except Exception as e:
             logger.error(f"Failed to scan assets in {mod_path}: {e}")
@@ -201,31 +228,37 @@ class GameDataHandler:
     def _get_content_hash(self, folder_path: Path) -> str:
         """Calculate hash based on folder structure and file sizes."""
         try:
-            # Get all files recursively
-            pbo_files = list(folder_path.rglob('*.pbo'))
+            # Get all PBO files recursively
+            pbo_files = [entry for entry in walk_files(folder_path)
+                         if entry.name.lower().endswith('.pbo')]
             if not pbo_files:
                 return ""
                 
             # Sort for consistent hashing
-            pbo_files.sort()
+            pbo_files.sort(key=lambda e: e.path)
             
-            # Combine path and size information
-            content_info = [f"{p.relative_to(folder_path)}:{p.stat().st_size}" 
-                          for p in pbo_files]
-            
-            # Create hash of all paths and sizes
-            return hashlib.blake2b(
-                "|".join(content_info).encode(), 
-                digest_size=16
-            ).hexdigest()
+            # Feed path and size information straight into the hash
+            root_len = len(os.fspath(folder_path)) + 1
+            hasher = new_folder_hasher()
+            for i, entry in enumerate(pbo_files):
+                if i:
+                    hasher.update(b'|')
+                hasher.update(entry.path[root_len:].encode())
+                hasher.update(b':')
+                hasher.update(str(entry.stat().st_size).encode())
+            return hasher.hexdigest()
             
         except Exception as e:
             logger.error(f"Failed to calculate content hash for {folder_path}: {e}")
             return ""
 
-    def _get_cache_paths(self, folder_path: Path) -> Tuple[Path, Path]:
-        """Generate cache paths using content-based hash."""
+    def _get_cache_paths(self, folder_path: Path) -> Optional[Tuple[Path, Path]]:
+        """Generate cache paths using content-based hash, None if the folder can't be hashed."""
         content_hash = self._get_content_hash(folder_path)
+        if not content_hash:
+            # An empty hash (no PBOs or a failed walk) would share one "<name>_" key,
+            # callers still scan the folder but skip the cache
+            return None
         base_name = f"{folder_path.name}_{content_hash}"
         return (
             self.class_cache_dir / f"{base_name}_classes.json",
@@ -262,8 +295,10 @@ class GameDataHandler:
         
     def _get_mod_folders(self, mod_path: Path) -> List[Path]:
         """Get all immediate @-prefixed folders within the mod path."""
-        return [p for p in mod_path.iterdir() 
-                if p.is_dir() and p.name.startswith('@')]
+        # Check the name first and take the entry type from the listing, no stat per child
+        with os.scandir(mod_path) as it:
+            return [Path(entry.path) for entry in it
+                    if entry.name.startswith('@') and entry.is_dir()]
 
     def close(self) -> None:
         """Cleanup resources."""
@@ -1,17 +1,54 @@
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Set, Tuple, Union
+import asyncio
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import threading
+from importlib import metadata
+from concurrent.futures import Executor
 from mission_scanner import MissionScannerAPI, ScanResult, MissionScannerAPIConfig
 
+from dependency_scanner.core.utils.fs import atomic_write_bytes, ensure_dir, new_folder_hasher, walk_files
+from dependency_scanner.core.utils.pool import get_shared_io_executor
+
 logger = logging.getLogger(__name__)
 
+MISSION_INDICATORS = frozenset(("mission.sqm", "description.ext", "init.sqf"))
+
+# Bump when the pickled result layout changes, results are pickles of mission_scanner objects
+RESULT_CACHE_FORMAT = 1
+
+def _result_cache_version() -> str:
+    """Version tag for cached results, changes with the format or the mission_scanner release."""
+    try:
+        library_version = metadata.version("mission_scanner")
+    except metadata.PackageNotFoundError:
+        library_version = "unknown"
+    return f"v{RESULT_CACHE_FORMAT}-{library_version}"
+
+def _create_scanner(cache_dir: Path, max_workers: int) -> MissionScannerAPI:
+    """Create a mission scanner API for the given cache directory."""
+    config = MissionScannerAPIConfig(
+        max_workers=max_workers,
+        cache_max_size=1_000_000,  # 1M entries
+    )
+    return MissionScannerAPI(
+        cache_dir=cache_dir,
+        config=config
+    )
+
 class MissionScanningService:
     """Handles all mission scanning operations."""
     
-    def __init__(self, max_workers: int = 30, cache_dir: Optional[Path] = None):
+    def __init__(self, max_workers: int = 30, cache_dir: Optional[Path] = None,
+                 executor: Optional[Executor] = None):
         self.max_workers = max_workers
-        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor = executor or get_shared_io_executor(max_workers)
+        # MissionScannerAPI runs its own worker pool and isn't known to be thread-safe,
+        # only hashing and result cache lookups overlap, the scans themselves take turns
+        self._scan_lock = threading.Lock()
         
         # Ensure proper cache directory structure
         if cache_dir:
@@ -19,16 +56,14 @@ class MissionScanningService:
         else:
             mission_cache_dir = Path(".cache/missions")
             
-        mission_cache_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(mission_cache_dir)
         
-        config = MissionScannerAPIConfig(
-            max_workers=max_workers,
-            cache_max_size=1_000_000,  # 1M entries
-        )
-        self._scanner = MissionScannerAPI(
-            cache_dir=mission_cache_dir,
-            config=config
-        )
+        # Pickled scan results keyed by mission content
+        self._results_dir = mission_cache_dir / "results"
+        ensure_dir(self._results_dir)
+        self._cache_version = _result_cache_version()
+        
+        self._scanner = _create_scanner(mission_cache_dir, max_workers)
         
     def scan_missions(self, mission_paths: List[Path]) -> Dict[Path, ScanResult]:
         """Scan multiple missions using built-in caching."""
@@ -37,20 +72,130 @@ class MissionScanningService:
             logger.error("No valid mission paths found")
             return {}
             
-        results = {}
-        for path in valid_paths:
-            try:
-                # MissionScannerAPI handles caching internally
-                if result := self._scanner.scan_directory(path):
-                    results[path] = result
+        # map keeps results in path order and needs no future -> path lookup
+        return self._collect_results(
+            valid_paths,
+            self._executor.map(self._scan_single_mission, valid_paths)
+        )
+
+    async def scan_missions_async(self, mission_paths: List[Path]) -> Dict[Path, ScanResult]:
+        """Scan multiple missions from async code without blocking the event loop."""
+        # Validation fans out on the shared pool itself, so keep it off that pool
+        valid_paths = await asyncio.to_thread(self._validate_mission_paths, mission_paths)
+        if not valid_paths:
+            logger.error("No valid mission paths found")
+            return {}
+            
+        loop = asyncio.get_running_loop()
+        scan_results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self._scan_single_mission, path)
+            for path in valid_paths
+        ))
+        return self._collect_results(valid_paths, scan_results)
+
+    def _collect_results(self,
+                         valid_paths: List[Path],
+                         scan_results: Iterable[Optional[ScanResult]]) -> Dict[Path, ScanResult]:
+        """Pair scan results with their paths, dropping failed scans."""
+        pairs = []
+        log_info = logger.isEnabledFor(logging.INFO)
+        for path, result in zip(valid_paths, scan_results):
+            if result:
+                pairs.append((path, result))
+                if log_info:
                     logger.info(f"Completed scan of mission: {path.name}")
                     logger.info(f"Classes: {len(result.classes)}")
                     logger.info(f"Equipment: {len(result.equipment)}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to scan mission {path}: {e}")
                 
-        return results
+        return dict(pairs)
+
+    def _scan_single_mission(self, path: Path) -> Optional[ScanResult]:
+        """Scan a single mission, reusing the cached result if its files are unchanged."""
+        try:
+            mission_hash = self._get_mission_hash(path)
+            cache_file = self._get_result_cache_file(path, mission_hash) if mission_hash else None
+            
+            if cache_file and (cached := self._load_cached_result(cache_file)):
+                logger.debug(f"Using cached scan result for mission: {path.name}")
+                return cached
+            
+            result = self._scan_directory(path)
+            if result and cache_file:
+                self._save_cached_result(cache_file, result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to scan mission {path}: {e}")
+            return None
+
+    def _scan_directory(self, path: Path) -> Optional[ScanResult]:
+        """Run the actual mission scan, one at a time on the shared scanner API."""
+        with self._scan_lock:
+            return self._scanner.scan_directory(path)
+
+    def _get_mission_hash(self, path: Path) -> str:
+        """Calculate hash based on file paths, sizes and modification times."""
+        try:
+            hasher = new_folder_hasher()
+            root_len = len(os.fspath(path)) + 1
+            for entry in sorted(walk_files(path), key=lambda e: e.path):
+                stats = entry.stat()
+                hasher.update(f"{entry.path[root_len:]}:{stats.st_mtime_ns}:{stats.st_size}|".encode())
+            return hasher.hexdigest()
+            
+        except Exception as e:
+            logger.warning(f"Failed to calculate mission hash for {path}: {e}")
+            return ""
+
+    def _get_result_cache_file(self, path: Path, mission_hash: str) -> Path:
+        """Get the cache file for a mission, one folder per mission so older results can be pruned."""
+        # Same-named missions in different folders must not evict each other, and
+        # a prefix shard keeps the results folder small for large mission sets
+        path_digest = hashlib.blake2b(os.fspath(path).encode(), digest_size=4).hexdigest()
+        mission_dir = ensure_dir(self._results_dir / path_digest[:2] / f"{path.name}_{path_digest}")
+        return mission_dir / f"{self._cache_version}_{mission_hash}.pkl"
+
+    def _load_cached_result(self, cache_file: Path) -> Optional[ScanResult]:
+        """Load a pickled scan result if present."""
+        try:
+            with cache_file.open('rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load cached mission result {cache_file.name}: {e}")
+            return None
+
+    def _save_cached_result(self, cache_file: Path, result: ScanResult) -> None:
+        """Persist a scan result for later runs."""
+        try:
+            atomic_write_bytes(cache_file, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.warning(f"Failed to cache mission result {cache_file.name}: {e}")
+            return
+        self._prune_cached_results(cache_file)
+
+    @staticmethod
+    def _prune_cached_results(cache_file: Path) -> None:
+        """Remove results of older mission contents or cache versions next to the current one."""
+        try:
+            with os.scandir(cache_file.parent) as it:
+                stale = [entry.path for entry in it
+                         if entry.name.endswith('.pkl') and entry.name != cache_file.name]
+            for stale_path in stale:
+                os.unlink(stale_path)
+        except OSError as e:
+            logger.warning(f"Failed to prune cached mission results for {cache_file.parent.name}: {e}")
+
+    def __enter__(self) -> 'MissionScanningService':
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Optional[type],
+                 exc_val: Optional[Exception],
+                 exc_tb: Optional[type]) -> None:
+        """Context manager exit with cleanup."""
+        self.close()
 
     def close(self) -> None:
         """Clean up resources."""
@@ -58,23 +203,48 @@ class MissionScanningService:
             self._scanner.cleanup()
 
     @staticmethod
-    def is_mission_directory(path: Path) -> bool:
+    def is_mission_directory(path: Union[Path, str]) -> bool:
         """Check if directory contains mission files. Made static for reuse."""
-        if not path.is_dir():
+        try:
+            with os.scandir(path) as it:
+                names = {entry.name for entry in it if entry.is_file()}
+        except OSError:
             return False
             
-        indicators = ["mission.sqm", "description.ext", "init.sqf"]
-        return any((path / indicator).exists() for indicator in indicators)
+        return not names.isdisjoint(MISSION_INDICATORS)
 
     def _validate_mission_paths(self, paths: List[Path]) -> List[Path]:
         """Filter and validate mission paths."""
+        # Check roots and their subfolders on the pool so slow stat calls overlap
+        root_flags = list(self._executor.map(self.is_mission_directory, paths))
+        
+        # Roots are already known missions, subfolders still need checking
+        candidates: List[Tuple[str, bool]] = []
+        for path, is_mission in zip(paths, root_flags):
+            # Pure string normalization, avoids resolve()'s per-component stat calls.
+            # Entries listed from a normalized root are already normalized.
+            root = os.path.normpath(os.path.abspath(path))
+            if is_mission:
+                candidates.append((root, False))
+                continue
+            try:
+                # Entry types come from the directory listing, no stat per child
+                with os.scandir(root) as it:
+                    candidates.extend((entry.path, True) for entry in it if entry.is_dir())
+            except OSError:
+                continue
+        
+        subfolder_flags = iter(self._executor.map(
+            self.is_mission_directory,
+            [candidate for candidate, needs_check in candidates if needs_check]
+        ))
+        
         valid_paths = []
-        for path in paths:
-            if self.is_mission_directory(path):
-                valid_paths.append(path.resolve())
-            elif path.is_dir():
-                valid_paths.extend(
-                    p.resolve() for p in path.iterdir()
-                    if p.is_dir() and self.is_mission_directory(p)
-                )
+        seen: Set[str] = set()
+        for candidate, needs_check in candidates:
+            if needs_check and not next(subfolder_flags):
+                continue
+            if candidate not in seen:
+                seen.add(candidate)
+                valid_paths.append(Path(candidate))
         return valid_paths
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import NamedTuple, Set, Dict, Any, List, Tuple
-from fnmatch import fnmatch
+from fnmatch import translate
+import re
 
 IGNORED_CATEGORIES = {
     "traits[]",
@@ -69,27 +72,30 @@ class EquipmentIgnoreList:
         base_patterns.extend(patterns)
         # Filter out empty patterns and ensure they're lowercase
         self.patterns = [p.lower() for p in base_patterns if p]
+        # Combine all globs into one regex so each lookup is a single match
+        self._regex = re.compile(
+            "|".join(f"(?:{translate(p)})" for p in self.patterns)
+        ) if self.patterns else None
         
     def should_ignore(self, equipment_name: str) -> bool:
         """Check if equipment name matches any ignore pattern."""
-        if not equipment_name:  # Don't match empty strings
+        if not equipment_name or self._regex is None:  # Don't match empty strings
             return False
             
-        name = equipment_name.lower()
-        return any(fnmatch(name, pattern) for pattern in self.patterns)
+        return self._regex.match(equipment_name.lower()) is not None
     
     @staticmethod
     def from_config(config: List[str]) -> 'EquipmentIgnoreList':
         return EquipmentIgnoreList([p for p in (config or []) if p])  # Filter empty patterns
 
-@dataclass
+@dataclass(slots=True)
 class ScanTask:
     """Scanning task configuration."""
     name: str
     data_path: List[Path]
     ignore_patterns: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class MissionClass:
     """Represents a class definition from a mission file."""
     name: str
@@ -103,7 +109,7 @@ class MissionClass:
         """Get values for a property.""" 
         return self.properties.get(name, [])
 
-@dataclass
+@dataclass(slots=True)
 class PropertyValidationResult:
     """Validation results for a specific property type."""
     property_type: str
@@ -111,17 +117,17 @@ class PropertyValidationResult:
     missing_values: Set[str]
     ignored_values: Set[str]
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Mission scan results with added suggestions."""
     equipment: Set[str] = field(default_factory=set)
-    valid_assets: Set[Path] = field(default_factory=set)
-    invalid_assets: Set[Path] = field(default_factory=set)
+    valid_assets: Set[str] = field(default_factory=set)
+    invalid_assets: Set[str] = field(default_factory=set)
     property_results: Dict[str, Any] = field(default_factory=dict)
     class_details: Dict[str, Any] = field(default_factory=dict)
     class_suggestions: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Results of dependency validation."""
     valid_assets: Set[str]
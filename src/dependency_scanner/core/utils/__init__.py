@@ -1,9 +1,10 @@
 import logging
-import subprocess
+import shutil
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-def setup_logging(debug: bool = False):
+def setup_logging(debug: bool = False) -> logging.Logger:
     """Configure logging for the application."""
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
@@ -13,10 +14,7 @@ def setup_logging(debug: bool = False):
     )
     return logging.getLogger('dependency_scanner')
 
+@lru_cache(maxsize=1)
 def check_mikero_tools() -> bool:
     """Check if mikero's tools (specifically ExtractPbo) are available in PATH."""
-    try:
-        subprocess.run(['ExtractPbo', '-P'], capture_output=True)
-        return True
-    except FileNotFoundError:
-        return False
+    return shutil.which('ExtractPbo') is not None
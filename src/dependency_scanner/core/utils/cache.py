@@ -10,6 +10,8 @@ from class_scanner.models import ClassData
 from asset_scanner.models import Asset
 from asset_scanner.config import APIConfig
 
+from dependency_scanner.core.utils.fs import ensure_dir
+
 logger = logging.getLogger(__name__)
 
 def calculate_folder_hash(folder_path: Path) -> str:
@@ -78,7 +80,7 @@ class CacheManager:
         # Ensure all cache directories exist
         for directory in (self.class_cache_dir, self.asset_cache_dir, 
                         self.base_game_dir, self.tasks_dir, self.missions_dir):
-            directory.mkdir(parents=True, exist_ok=True)
+            ensure_dir(directory)
         
         self._default_class_api = ClassAPI(cache_dir=self.class_cache_dir)
         self._default_asset_api = AssetAPI(config=APIConfig(
@@ -91,8 +93,8 @@ class CacheManager:
         class_cache_dir = task_dir / "classes"
         asset_cache_dir = task_dir / "assets"
         
-        class_cache_dir.mkdir(parents=True, exist_ok=True)
-        asset_cache_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(class_cache_dir)
+        ensure_dir(asset_cache_dir)
         
         return (
             ClassAPI(cache_dir=class_cache_dir),
@@ -110,7 +112,7 @@ class CacheManager:
                 cache_dir = self.base_game_dir
             else:
                 cache_dir = self.tasks_dir / task if task else self.tasks_dir
-            cache_dir.mkdir(parents=True, exist_ok=True)
+            ensure_dir(cache_dir)
             
             # Create task-specific APIs
             class_api, asset_api = self.create_apis(cache_dir)
@@ -0,0 +1,64 @@
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, List, Optional, Union
+import hashlib
+import os
+import tempfile
+
+xxhash: Optional[ModuleType]
+try:
+    import xxhash  # type: ignore[no-redef]
+except ImportError:  # Optional, falls back to hashlib
+    xxhash = None
+
+def walk_files(folder_path: Union[str, Path]) -> List[os.DirEntry]:
+    """Collect all file entries below a folder using cached dirent types.
+
+    Like Path.rglob, file symlinks are followed and unreadable folders are skipped.
+    """
+    files: List[os.DirEntry] = []
+    stack = [os.fspath(folder_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Directory symlinks are not descended into, so links can't loop
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError:
+            continue
+    return files
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> Path:
+    """Create a directory and its parents once per process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+# os.umask can only be read by setting it, so read it once at import while
+# the process is still single-threaded rather than racing pool threads later
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling and os.replace, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file as 0600, give it the mode a plain open() would
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def new_folder_hasher() -> Any:
+    """Create the fastest available non-cryptographic hasher for cache keys."""
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
@@ -0,0 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_shared_io_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """Get the process-wide executor used for I/O-bound scanning work.
+
+    max_workers sizes the executor when this call creates it, later calls share it as is.
+    """
+    global _shared_executor
+    with _executor_lock:
+        if _shared_executor is None:
+            if max_workers is None:
+                max_workers = min(32, (os.cpu_count() or 1) * 2)
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="dependency_scanner_io"
+            )
+            logger.debug(f"Created shared I/O executor with {max_workers} workers")
+        return _shared_executor
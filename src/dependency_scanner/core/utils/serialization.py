@@ -0,0 +1,29 @@
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+import json
+
+from dependency_scanner.core.utils.fs import atomic_write_bytes
+
+orjson: Optional[ModuleType]
+try:
+    import orjson  # type: ignore[no-redef]
+except ImportError:  # Optional, falls back to stdlib json
+    orjson = None
+
+def dump_json(data: Any, path: Path, indent: bool = False) -> None:
+    """Write data to a UTF-8 JSON file, compact unless indent is requested."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        payload = orjson.dumps(data, option=option)
+    else:
+        separators = None if indent else (',', ':')
+        payload = json.dumps(data, indent=2 if indent else None,
+                             separators=separators).encode('utf-8')
+    atomic_write_bytes(path, payload)
+
+def load_json(path: Path) -> Any:
+    """Read a JSON file written by dump_json."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
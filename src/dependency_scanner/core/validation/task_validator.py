@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Dict, Optional
 import logging
+from collections import ChainMap
 
 from mission_scanner import ScanResult
 
@@ -38,6 +39,24 @@ class TaskValidator:
                      task_content: ContentScanResult,
                      format_type: str = "text") -> Optional[TaskValidationResult]:
         """Validate task and generate report."""
+        validation_results = self.validate_only(task_name, mission_results, game_content, task_content)
+        if not validation_results:
+            return None
+            
+        try:
+            report_path = self.write_reports(task_name, validation_results, game_content, task_content, format_type)
+        except Exception as e:
+            logger.error(f"Task validation failed: {e}")
+            return None
+            
+        return TaskValidationResult(validation_results, report_path)
+
+    def validate_only(self,
+                      task_name: str,
+                      mission_results: Dict[Path, ScanResult],
+                      game_content: ContentScanResult,
+                      task_content: ContentScanResult) -> Optional[Dict[Path, ValidationResult]]:
+        """Validate task content without writing any reports."""
         try:
             validation_results = self.validator.validate_content(
                 mission_results=mission_results,
@@ -48,7 +67,13 @@ class TaskValidator:
                 task_content={
                     'classes': task_content.classes,
                     'assets': task_content.assets
-                }
+                },
+                # Game content is shared across tasks, layer its cached lowercase
+                # map under the task's instead of copying it per task
+                content_classes_lower=ChainMap(
+                    task_content.classes_lower,
+                    game_content.classes_lower
+                )
             )
             
             if not validation_results:
@@ -56,42 +81,50 @@ class TaskValidator:
 
             # Store results for potential later comparison
             self.validation_results[task_name] = validation_results
-            
-            # Analyze classes and write summary
-            class_sets = self.class_analyzer.analyze_results(validation_results)
-            summary_path = self.reports_dir / f"class_summary_{task_name}.txt"
-            self.class_analyzer.write_class_summary(summary_path, class_sets)
-
-            # Generate regular report
-            report_path = self.report_writer.write_report(
-                task_name,
-                validation_results,
-                format_type
-            )
-            
-            # After report is written, generate suggestions
-            all_missing_classes = set()
-            for result in validation_results.values():
-                all_missing_classes.update(result.missing_classes)
-            
-            if all_missing_classes:
-                available_classes = set(game_content.classes.keys())
-                available_classes.update(task_content.classes.keys())
-                
-                suggestions = self.suggestion_generator.generate_suggestions(
-                    all_missing_classes,
-                    available_classes
-                )
-                
-                # Write suggestions to separate report
-                self.suggestion_generator.write_suggestion_report(
-                    self.reports_dir,
-                    task_name,
-                    suggestions
-                )
-            
-            return TaskValidationResult(validation_results, report_path)
+            return validation_results
             
         except Exception as e:
             logger.error(f"Task validation failed: {e}")
             return None
+
+    def write_reports(self,
+                      task_name: str,
+                      validation_results: Dict[Path, ValidationResult],
+                      game_content: ContentScanResult,
+                      task_content: ContentScanResult,
+                      format_type: str = "text") -> Optional[Path]:
+        """Write the class summary, report and suggestions for validated results, raising on failure."""
+        # Analyze classes and write summary
+        class_sets = self.class_analyzer.analyze_results(validation_results)
+        summary_path = self.reports_dir / f"class_summary_{task_name}.txt"
+        self.class_analyzer.write_class_summary(summary_path, class_sets)
+
+        # Generate regular report
+        report_path = self.report_writer.write_report(
+            task_name,
+            validation_results,
+            format_type
+        )
+        
+        # After report is written, generate suggestions
+        all_missing_classes = set().union(
+            *(result.missing_classes for result in validation_results.values())
+        )
+        
+        if all_missing_classes:
+            # Union of key views builds the set directly
+            available_classes = game_content.classes.keys() | task_content.classes.keys()
+            
+            suggestions = self.suggestion_generator.generate_suggestions(
+                all_missing_classes,
+                available_classes
+            )
+            
+            # Write suggestions to separate report
+            self.suggestion_generator.write_suggestion_report(
+                self.reports_dir,
+                task_name,
+                suggestions
+            )
+        
+        return report_path
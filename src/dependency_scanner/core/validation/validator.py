@@ -1,6 +1,8 @@
 from pathlib import Path
-from typing import Dict, Set, Any, Optional, Sequence, List, Tuple
+from typing import Dict, FrozenSet, Mapping, Set, Any, Optional, Sequence, List, Tuple
+import heapq
 import logging
+from collections import ChainMap
 
 from mission_scanner import ScanResult
 
@@ -19,6 +21,11 @@ class ScanResultAdapter:
     scan_result: ScanResult
     class_suggestions: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)
 
+    @property
+    def equipment(self) -> Any:
+        """Equipment of the wrapped scan result, so both types can be read the same way."""
+        return self.scan_result.equipment
+
 class DependencyValidator:
     """Validates mission dependencies against game and mod content."""
 
@@ -27,60 +34,102 @@ class DependencyValidator:
         self.ignore_list = EquipmentIgnoreList(list(ignore_patterns) if ignore_patterns else [])
         self.scan_adapters: Dict[Path, ScanResultAdapter] = {}
         self.fuzzy_matcher = FuzzyClassMatcher()  # Add fuzzy matcher instance
+        # Lowercased equipment per equipment collection, keyed by id() with the
+        # collection kept alive so the id can't be reused while cached
+        self._equipment_lower: Dict[int, Tuple[Any, FrozenSet[str]]] = {}
+        # Mission results the equipment cache belongs to, it is dropped when they change
+        self._equipment_lower_owner: Optional[Dict[Path, ScanResult]] = None
+        # (game classes, task classes, lowercase map, candidate names) of the last run
+        self._content_cache: Optional[Tuple[Any, Any, Mapping[str, str], FrozenSet[str]]] = None
+        # Names of the bottom (game) layer of a layered lowercase map, shared across tasks
+        self._base_class_names: Optional[Tuple[Mapping[str, str], FrozenSet[str]]] = None
 
     def validate_content(self,
                          mission_results: Dict[Path, ScanResult],
                          game_content: Dict[str, Any],
-                         task_content: Dict[str, Any]) -> Optional[Dict[Path, ValidationResult]]:
+                         task_content: Dict[str, Any],
+                         content_classes_lower: Optional[Mapping[str, str]] = None) -> Optional[Dict[Path, ValidationResult]]:
+
+        """Validate mission content against game and task content.
 
-        """Validate mission content against game and task content."""
+        content_classes_lower may carry a precomputed lowercase -> original
+        name mapping of the combined classes (e.g. a ChainMap of per-content
+        maps), otherwise it is built here.
+        """
         try:
             # Reset adapters for new validation
             self.scan_adapters.clear()
+            
+            # Equipment lookups are reused across tasks for the same missions only
+            if mission_results is not self._equipment_lower_owner:
+                self._equipment_lower.clear()
+                self._equipment_lower_owner = mission_results
 
             # Don't require task content
             if not game_content.get('classes'):
                 logger.error("Game content is empty")
                 return None
 
-            # Merge game and task content
-            combined_classes = {
-                **game_content.get('classes', {}),
-                **task_content.get('classes', {})
-            }
-            
-            combined_assets = {
-                **game_content.get('assets', {}),
-                **task_content.get('assets', {})
-            }
-
-            # Verify merge was successful
-            if len(combined_classes) < (len(game_content.get('classes', {})) + len(task_content.get('classes', {}))):
-                logger.warning(
-                    f"Potential class overlap detected: {len(game_content.get('classes', {})) + len(task_content.get('classes', {})) - len(combined_classes)} "
-                    f"classes may have been overwritten"
-                )
+            game_classes = game_content.get('classes', {})
+            task_classes = task_content.get('classes', {})
+            game_assets = game_content.get('assets', {})
+            task_assets = task_content.get('assets', {})
 
-            if len(combined_assets) < (len(game_content.get('assets', {})) + len(task_content.get('assets', {}))):
-                logger.warning(
-                    f"Potential asset overlap detected: {len(game_content.get('assets', {})) + len(task_content.get('assets', {})) - len(combined_assets)} "
-                    f"assets may have been overwritten"
-                )
+            # Layer task content over game content without copying either
+            combined_classes = ChainMap(task_classes, game_classes)
+            combined_assets = ChainMap(task_assets, game_assets)
 
             # Ensure we have content to validate against
             if not combined_classes and not combined_assets:
                 logger.error("No content available for validation")
                 return None
 
-            logger.info(f"Validating against {len(combined_classes)} classes and {len(combined_assets)} assets")
+            # Overlap counts only feed log messages, skip the key intersections otherwise
+            if logger.isEnabledFor(logging.WARNING):
+                # Keys present in both layers are shadowed by task content
+                class_overlap = len(task_classes.keys() & game_classes.keys())
+                if class_overlap:
+                    logger.warning(
+                        f"Potential class overlap detected: {class_overlap} "
+                        f"classes may have been overwritten"
+                    )
+
+                asset_overlap = len(task_assets.keys() & game_assets.keys())
+                if asset_overlap:
+                    logger.warning(
+                        f"Potential asset overlap detected: {asset_overlap} "
+                        f"assets may have been overwritten"
+                    )
+
+                if logger.isEnabledFor(logging.INFO):
+                    class_count = len(game_classes) + len(task_classes) - class_overlap
+                    asset_count = len(game_assets) + len(task_assets) - asset_overlap
+                    logger.info(f"Validating against {class_count} classes and {asset_count} assets")
+            
+            # Reuse the lookups when validating against the same content objects again
+            cached = self._content_cache
+            if cached is not None and cached[0] is game_classes and cached[1] is task_classes:
+                content_classes_lower, content_class_names = cached[2], cached[3]
+            else:
+                # Lowercase lookup is shared by every mission, build it once
+                if content_classes_lower is None:
+                    content_classes_lower = {k.lower(): k for k in combined_classes}
+                # Fuzzy suggestion candidates, shared by every mission and missing class
+                content_class_names = self._get_class_names(content_classes_lower)
+                self._content_cache = (game_classes, task_classes,
+                                       content_classes_lower, content_class_names)
             
+            # Sequential on purpose, the work is CPU-bound under the GIL and every
+            # mission shares the fuzzy matcher's candidate index for this frozenset
             validation_results = {}
             for mission_path, scan_result in mission_results.items():
                 # Don't wrap in adapter if direct usage works
                 validation_results[mission_path] = self._validate_single_mission(
                     scan_result,
                     combined_classes,
-                    combined_assets
+                    combined_assets,
+                    content_classes_lower,
+                    content_class_names
                 )
                 
             return validation_results
@@ -91,16 +140,23 @@ class DependencyValidator:
 
     def _validate_single_mission(self,
                                  scan_result: ScanResult | ScanResultAdapter,
-                                 classes: Dict[str, Any],
-                                 assets: Dict[str, Any]) -> ValidationResult:
+                                 classes: Mapping[str, Any],
+                                 assets: Mapping[str, Any],
+                                 content_classes_lower: Optional[Mapping[str, str]] = None,
+                                 content_class_names: Optional[FrozenSet[str]] = None) -> ValidationResult:
         """Validate a single mission's dependencies."""
+        if content_classes_lower is None:
+            content_classes_lower = {k.lower(): k for k in classes}
+        if content_class_names is None:
+            content_class_names = frozenset(content_classes_lower)
         valid_classes: Set[str] = set()
         missing_classes: Set[str] = set()
         valid_assets: Set[str] = set()
         missing_assets: Set[str] = set()
         suggestions: Dict[str, List[Tuple[str, float]]] = {}
 
-        self._validate_classes(scan_result, classes, valid_classes, missing_classes, suggestions)
+        self._validate_classes(scan_result, content_classes_lower, content_class_names,
+                               valid_classes, missing_classes, suggestions)
 
         return ValidationResult(
             valid_assets=valid_assets,
@@ -113,49 +169,91 @@ class DependencyValidator:
 
     def _validate_classes(self,
                           scan_result: ScanResult | ScanResultAdapter,
-                          classes: Dict[str, Any],
+                          content_classes_lower: Mapping[str, str],
+                          content_class_names: FrozenSet[str],
                           valid_classes: Set[str],
                           missing_classes: Set[str],
                           suggestions: Dict[str, List[Tuple[str, float]]]) -> None:
-        """Validate class dependencies."""
-        # Handle both direct ScanResult and adapter
-        if isinstance(scan_result, ScanResultAdapter):
-            equipment = scan_result.scan_result.equipment
-        else:
-            equipment = scan_result.equipment
-
-        # Get equipment names, handling both Set[str] and Dict[str, Any] types
-        if isinstance(equipment, dict):
-            equipment_names = equipment.keys()
-        else:
-            equipment_names = equipment
+        """Validate class dependencies against a lowercase -> original class name map."""
+        # ScanResult and ScanResultAdapter both expose equipment
+        equipment = scan_result.equipment
 
-        logger.info(f"Starting validation of {len(equipment_names)} equipment classes")
+        logger.info(f"Starting validation of {len(equipment)} equipment classes")
 
         # Convert all class names to lowercase for case-insensitive comparison
-        equipment_classes_lower = {str(class_name).lower() 
-                                 for class_name in equipment_names if class_name}
-        content_classes_lower = {k.lower(): k for k in classes.keys()}
+        equipment_classes_lower = self._get_equipment_lower(equipment)
+
+        # Skip formatting per-class debug messages unless they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
 
+        # Drop ignored equipment, then split the rest with set operations
+        should_ignore = self.ignore_list.should_ignore
+        checked_classes = set()
         for class_name_lower in equipment_classes_lower:
-            # Skip ignored equipment
-            if self.ignore_list.should_ignore(class_name_lower):
-                logger.debug(f"Ignoring class: '{class_name_lower}' - Matches ignore pattern")
+            if should_ignore(class_name_lower):
+                if debug:
+                    logger.debug(f"Ignoring class: '{class_name_lower}' - Matches ignore pattern")
                 continue
+            checked_classes.add(class_name_lower)
 
-            if class_name_lower in content_classes_lower:
-                original_name = content_classes_lower[class_name_lower]
-                logger.debug(f"Found valid class: '{original_name}'")
-                valid_classes.add(original_name)
-            else:
+        # difference() with the large frozenset probes it per name instead of iterating it
+        missing = checked_classes.difference(content_class_names)
+        present = checked_classes - missing
+        valid_classes.update(content_classes_lower[k] for k in present)
+        missing_classes.update(missing)
+
+        if not missing:
+            return
+            
+        if debug:
+            for class_name_lower in missing:
                 logger.debug(f"Missing class: '{class_name_lower}' - Not found in available content")
-                missing_classes.add(class_name_lower)
-                # Generate suggestions for missing class
-                fuzzy_result = self.fuzzy_matcher.find_similar_classes(
-                    class_name_lower, 
-                    set(content_classes_lower.keys())
-                )
-                if fuzzy_result.matches:  # Access matches from FuzzyMatchResult
-                    suggestions[class_name_lower] = [
-                        (content_classes_lower[s[0]], s[1]) for s in fuzzy_result.matches
-                    ]
+                
+        # Bound the fuzzy work when a misconfigured task misses nearly everything
+        queries = list(missing)
+        suggestion_budget = self.fuzzy_matcher.config.max_suggestions_total
+        if len(queries) > suggestion_budget:
+            logger.warning(
+                f"{len(queries)} missing classes, only generating suggestions "
+                f"for the first {suggestion_budget}"
+            )
+            # Only the first names are kept, no need to sort them all
+            queries = heapq.nsmallest(suggestion_budget, queries)
+            
+        # Generate suggestions for all missing classes in one pass over the candidates
+        batch_results = self.fuzzy_matcher.find_similar_classes_batch(
+            queries,
+            content_class_names
+        )
+        for class_name_lower, fuzzy_result in batch_results.items():
+            if fuzzy_result.matches:  # Access matches from FuzzyMatchResult
+                suggestions[class_name_lower] = [
+                    (content_classes_lower[name], score) for name, score in fuzzy_result.matches
+                ]
+
+    def _get_class_names(self, classes_lower: Mapping[str, str]) -> FrozenSet[str]:
+        """Get the lowercase class names of a lookup, reusing the game layer of a ChainMap."""
+        if not isinstance(classes_lower, ChainMap) or len(classes_lower.maps) < 2:
+            return frozenset(classes_lower)
+            
+        base = classes_lower.maps[-1]
+        cached = self._base_class_names
+        if cached is None or cached[0] is not base:
+            cached = (base, frozenset(base))
+            self._base_class_names = cached
+            
+        # Without task names the game set itself is returned, keeping the fuzzy index
+        layers = [m for m in classes_lower.maps[:-1] if m]
+        return cached[1].union(*layers) if layers else cached[1]
+
+    def _get_equipment_lower(self, equipment: Any) -> FrozenSet[str]:
+        """Get the lowercased equipment names, computed once per equipment collection."""
+        cached = self._equipment_lower.get(id(equipment))
+        if cached is not None and cached[0] is equipment:
+            return cached[1]
+            
+        # Handles both Set[str] and Dict[str, Any] equipment
+        equipment_lower = frozenset(str(class_name).lower()
+                                    for class_name in equipment if class_name)
+        self._equipment_lower[id(equipment)] = (equipment, equipment_lower)
+        return equipment_lower
@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from typing import List, Optional, Dict
 import argparse
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from mission_scanner import ScanResult
 
@@ -13,11 +15,13 @@ from dependency_scanner.core.scanning.content_scanner import ContentScanResult,
 from dependency_scanner.core.validation.task_validator import TaskValidator
 from dependency_scanner.core.scanning.mission_scanner import MissionScanningService
 from dependency_scanner.core.analysis.result_differ import ResultDiffer
+from dependency_scanner.core.utils.fs import ensure_dir
 
 logger = logging.getLogger(__name__)
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(description="Validate Arma 3 mission dependencies")
     parser.add_argument("--config", type=Path, default="config.json", help="Path to config file")
     parser.add_argument("--mission", type=Path, help="Single mission to scan")
@@ -26,7 +30,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--workers", type=int, default=31, help="Number of worker threads")
-    return parser.parse_args()
+    return parser
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 class Scanner:
     """High-level scanner interface."""
@@ -35,15 +43,21 @@ class Scanner:
         self.cache_dir = cache_dir
         self.game_path = game_path
         self.max_workers = max_workers
+        # One I/O pool sized by --workers, shared by the mission and content scanners
+        self._io_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dependency_scanner_io")
         
         # Initialize components with consistent cache paths
         self.mission_scanner = MissionScanningService(
             max_workers=max_workers,
-            cache_dir=cache_dir  # Parent cache dir, service will append "missions"
+            cache_dir=cache_dir,  # Parent cache dir, service will append "missions"
+            executor=self._io_executor
         )
-        self.content_scanner = ContentScanner(cache_dir, max_workers)
+        self.content_scanner = ContentScanner(cache_dir, max_workers, self._io_executor)
         self.task_validator = TaskValidator(max_workers, cache_dir / "reports")
         self.task_results = {}  # Store results by task name
+        # One writer keeps report generation ordered while the next task scans and validates
+        self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dependency_scanner_reports")
+        self._report_futures: Dict[str, Future] = {}
         
     def __enter__(self) -> 'Scanner':
         """Context manager entry."""
@@ -54,10 +68,16 @@ class Scanner:
                  exc_tb: Optional[type]) -> None:
         """Context manager exit with cleanup."""
         # Clean up resources
+        if hasattr(self, '_report_executor'):
+            self._wait_for_reports()
+            self._report_executor.shutdown(wait=True)
         if hasattr(self, 'content_scanner'):
             self.content_scanner.close()
         if hasattr(self, 'mission_scanner'):
             self.mission_scanner.close()
+        if hasattr(self, '_io_executor'):
+            # Cancel queued work so an aborted scan does not keep running on exit
+            self._io_executor.shutdown(wait=True, cancel_futures=True)
             
     def execute_scan(self, tasks: List[ScanTask], missions: List[Path], format_type: str = "text") -> bool:
         """Execute complete scan process."""
@@ -92,6 +112,12 @@ class Scanner:
                 if task_success:
                     ordered_task_names.append(task.name)
                     
+            # Report writing annotates the results, let it finish before comparing them
+            failed_reports = self._wait_for_reports()
+            if failed_reports:
+                success = False
+                ordered_task_names = [name for name in ordered_task_names if name not in failed_reports]
+                    
             # If we have multiple successful tasks, generate difference report
             if len(ordered_task_names) >= 2:
                 self._generate_difference_report(ordered_task_names, format_type)
@@ -117,27 +143,47 @@ class Scanner:
                 logger.error(f"Failed to scan task: {task.name}")
                 return False
             
-            # Validate task and generate report
-            validation_result = self.task_validator.validate_task(
+            # Validate task, reports are written in the background
+            validation_results = self.task_validator.validate_only(
                 task.name,
                 mission_results,
                 game_content,
-                task_content,
-                format_type
+                task_content
             )
             
-            if not validation_result:
+            if not validation_results:
                 logger.error(f"Failed to validate task: {task.name}")
                 return False
                 
-            # Store validation results from TaskValidationResult object
-            self.task_results[task.name] = validation_result.validation_results
+            self._report_futures[task.name] = self._report_executor.submit(
+                self.task_validator.write_reports,
+                task.name,
+                validation_results,
+                game_content,
+                task_content,
+                format_type
+            )
+            
+            # Store validation results for the difference report
+            self.task_results[task.name] = validation_results
             return True
             
         except Exception as e:
             logger.error(f"Failed to process task {task.name}: {e}")
             return False
 
+    def _wait_for_reports(self) -> List[str]:
+        """Wait for pending report writes, returns the names of tasks whose reports failed."""
+        failed = []
+        for task_name, future in self._report_futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to write reports for task {task_name}: {e}")
+                failed.append(task_name)
+        self._report_futures.clear()
+        return failed
+
     def _generate_difference_report(self, task_names: List[str], format_type: str) -> None:
         """Generate difference report between tasks."""
         try:
@@ -186,7 +232,7 @@ def main() -> int:
             return 1
 
         cache_dir = Path(args.cache or paths.get("cache", ".cache")).resolve()
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(cache_dir)
         
         with Scanner(cache_dir, game_path, args.workers) as scanner:
             success = scanner.execute_scan(tasks, missions, args.format)
@@ -0,0 +1,52 @@
+import os
+import stat
+
+import pytest
+
+from dependency_scanner.core.utils.fs import atomic_write_bytes, walk_files
+
+
+def test_walk_files_follows_file_symlinks(tmp_path):
+    """Test that symlinked files are found like Path.rglob finds them."""
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "mod.pbo").write_bytes(b"pbo")
+    addons = tmp_path / "@mod" / "addons"
+    addons.mkdir(parents=True)
+    os.symlink(source / "mod.pbo", addons / "mod.pbo")
+
+    names = [entry.name for entry in walk_files(tmp_path / "@mod")]
+    assert names == ["mod.pbo"]
+    assert names == [p.name for p in (tmp_path / "@mod").rglob("*.pbo")]
+
+
+def test_walk_files_skips_unreadable_folders(tmp_path, monkeypatch):
+    """Test that an unreadable subfolder is skipped instead of failing the walk."""
+    (tmp_path / "readable").mkdir()
+    (tmp_path / "readable" / "a.pbo").write_bytes(b"a")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "b.pbo").write_bytes(b"b")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if path == os.fspath(locked):
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    assert [entry.name for entry in walk_files(tmp_path)] == ["a.pbo"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes only")
+def test_atomic_write_bytes_uses_umask_mode(tmp_path):
+    """Test that atomically written files get the usual mode, not mkstemp's 0600."""
+    target = tmp_path / "report.json"
+    atomic_write_bytes(target, b"{}")
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+    assert target.read_bytes() == b"{}"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+    assert [p.name for p in tmp_path.iterdir()] == ["report.json"]
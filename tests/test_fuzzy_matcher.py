@@ -2,6 +2,7 @@ import pytest
 import random
 import string
 import time
+from dependency_scanner.core.analysis import fuzzy_matcher as fuzzy_matcher_module
 from dependency_scanner.core.analysis.fuzzy_matcher import FuzzyClassMatcher
 from dependency_scanner.core.analysis.fuzzy_config import FuzzyMatchConfig
 from dependency_scanner.core.analysis.fuzzy_result import FuzzyMatchResult
@@ -165,3 +166,60 @@ def test_batch_processing(fuzzy_matcher):
         assert result.matches, f"No matches found for {missing_class}"  # Should have matches
         assert len(result.matches) > 0
         assert result.matches[0][1] >= 0.5  # Should have reasonable confidence
+
+def test_category_index_matches_unfiltered(fuzzy_config, sample_classes):
+    # Reference matcher filters categories per candidate, without the prepared index
+    indexed = FuzzyClassMatcher(config=fuzzy_config)
+    reference = FuzzyClassMatcher(config=fuzzy_config)
+    reference._candidates_for_category = lambda index, category: [
+        c for c in index.candidates
+        if not category or reference.get_category_match(c.name) in (None, category)
+    ]
+
+    candidates = frozenset(sample_classes | {
+        'helmet_boonie_tan', 'cap_olive_mc', 'vest_plate_olive', 'rifle_black_mc',
+        'optic_scope_black', 'black_multicam_item', 'uniform_shirt_tan',
+    })
+    queries = [
+        'helmet_combat_blk', 'hat_boonie_blk', 'vest_carrier_tan', 'rifle_blk_mc',
+        'scope_optic_blk', 'combat_uniform_olive', 'item_black_multi', 'unknown_olive_thing',
+        # Close to candidates of another category, which the index must leave out
+        'helmet_carrier_blk', 'vest_combat_olive', 'cap_scope_black',
+    ]
+    # Twice, so the second pass goes through the cached category lists
+    for _ in range(2):
+        for query in queries:
+            expected = reference.find_similar_classes(query, candidates)
+            actual = indexed.find_similar_classes(query, candidates)
+            assert actual.matches == expected.matches, query
+            assert actual.category == expected.category
+
+@pytest.fixture(params=['difflib', 'rapidfuzz'])
+def ratio_backend(request, monkeypatch):
+    ratio = pytest.importorskip('rapidfuzz.fuzz').ratio if request.param == 'rapidfuzz' else None
+    monkeypatch.setattr(fuzzy_matcher_module, 'rapidfuzz_ratio', ratio)
+    return request.param
+
+def test_suggestions_per_ratio_backend(ratio_backend, fuzzy_matcher, sample_classes):
+    candidates = sample_classes | {'helmet_ech_olive', 'pants_black_ech_plate'}
+
+    # Typical typos give the same suggestions and scores with either backend
+    result = fuzzy_matcher.find_similar_classes('helmet_cmbt_olive', candidates)
+    assert result.matches == [
+        ('helmet_combat_olive', pytest.approx(0.8611, abs=1e-4)),
+        ('helmet_ech_olive', pytest.approx(0.7939, abs=1e-4)),
+    ]
+    result = fuzzy_matcher.find_similar_classes('vest_carier_blk', candidates)
+    assert result.matches == [('vest_carrier_black', pytest.approx(0.8164, abs=1e-4))]
+
+    # difflib's matching blocks undercount reordered words, so this one only passes with rapidfuzz
+    result = fuzzy_matcher.find_similar_classes('pants_plate_ech_tan', candidates)
+    expected = {'difflib': [], 'rapidfuzz': ['pants_black_ech_plate']}
+    assert [name for name, _ in result.matches] == expected[ratio_backend]
+
+def test_score_exactly_on_threshold_is_kept(ratio_backend):
+    # sub score 0.5 and base ratio 6/7 combine to exactly the default 0.75 threshold,
+    # the cutoffs derived from it must not prune the candidate through rounding
+    matcher = FuzzyClassMatcher()
+    result = matcher.find_similar_classes('helmet_olive_2_o', {'helmet_olive'})
+    assert result.matches == [('helmet_olive', pytest.approx(0.75))]
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mission_scanner import ScanResult
+
+from dependency_scanner.core.scanning.mission_scanner import MissionScanningService
+
+
+class CountingScanner:
+    """Stand-in for MissionScannerAPI that records scans and their overlap."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def scan_directory(self, path):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(path)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        result = ScanResult()
+        result.equipment = {path.name}
+        return result
+
+    def cleanup(self):
+        pass
+
+
+def make_mission(root, name):
+    mission = root / name
+    mission.mkdir(parents=True)
+    (mission / "mission.sqm").write_text("class Mission {};")
+    return mission
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+@pytest.fixture
+def service(tmp_path, executor):
+    service = MissionScanningService(max_workers=4, cache_dir=tmp_path / "cache", executor=executor)
+    service._scanner = CountingScanner()
+    yield service
+    service.close()
+
+
+def test_scans_are_serialized(tmp_path, service):
+    """Test that missions scanned from the pool never call the scanner API concurrently."""
+    missions = [make_mission(tmp_path / "missions", f"m{i}.Stratis") for i in range(8)]
+
+    results = service.scan_missions([tmp_path / "missions"])
+
+    assert sorted(p.name for p in results) == sorted(m.name for m in missions)
+    assert service._scanner.max_active == 1
+
+
+def cached_files(tmp_path):
+    return sorted((tmp_path / "cache" / "missions" / "results").rglob("*.pkl"))
+
+
+def test_result_cache_hit(tmp_path, service):
+    """Test that an unchanged mission is served from the result cache."""
+    mission = make_mission(tmp_path, "cached.Altis")
+
+    first = service.scan_missions([mission])
+    second = service.scan_missions([mission])
+
+    assert len(service._scanner.calls) == 1
+    assert second[mission].equipment == first[mission].equipment == {"cached.Altis"}
+    assert len(cached_files(tmp_path)) == 1
+
+
+def test_result_cache_invalidated_by_mtime(tmp_path, service):
+    """Test that touching a mission file rescans it and prunes the older result."""
+    mission = make_mission(tmp_path, "edited.Altis")
+    service.scan_missions([mission])
+    old_files = cached_files(tmp_path)
+
+    sqm = mission / "mission.sqm"
+    stats = sqm.stat()
+    os.utime(sqm, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1_000_000_000))
+    service.scan_missions([mission])
+
+    assert len(service._scanner.calls) == 2
+    new_files = cached_files(tmp_path)
+    assert len(new_files) == 1
+    assert new_files != old_files
+
+
+def test_result_cache_invalidated_by_version(tmp_path, service):
+    """Test that results cached under another cache version are not loaded."""
+    mission = make_mission(tmp_path, "upgraded.Altis")
+    service.scan_missions([mission])
+
+    service._cache_version = "v0-old"
+    service.scan_missions([mission])
+
+    assert len(service._scanner.calls) == 2
+    assert [p.name.split("_")[0] for p in cached_files(tmp_path)] == ["v0-old"]
+
+
+def test_scan_missions_async_matches_sync(tmp_path, service):
+    """Test that the async entry point returns the same missions in the same order."""
+    for i in range(3):
+        make_mission(tmp_path / "missions", f"a{i}.Tanoa")
+
+    async_results = asyncio.run(service.scan_missions_async([tmp_path / "missions"]))
+    sync_results = service.scan_missions([tmp_path / "missions"])
+
+    assert list(async_results) == list(sync_results)
+    assert [r.equipment for r in async_results.values()] == [r.equipment for r in sync_results.values()]
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from dependency_scanner.core.scanning.content_scanner import ContentScanResult
+from dependency_scanner.core.types import ScanTask, ValidationResult
+from dependency_scanner.scan import Scanner
+
+
+@pytest.fixture
+def scanner(tmp_path, monkeypatch):
+    with Scanner(tmp_path / "cache", tmp_path / "game", max_workers=2) as scanner:
+        mission = Path("test_mission")
+        content = ContentScanResult(classes={'existing_class': {}}, assets={})
+        result = ValidationResult(
+            valid_assets=set(),
+            valid_classes={'existing_class'},
+            missing_assets=set(),
+            missing_classes=set(),
+            property_results={},
+        )
+        monkeypatch.setattr(scanner.mission_scanner, 'scan_missions', lambda missions: {mission: object()})
+        monkeypatch.setattr(scanner.content_scanner, 'scan_content', lambda task, is_mod_folder=False: content)
+        monkeypatch.setattr(scanner.task_validator, 'validate_only', lambda *args: {mission: result})
+        yield scanner
+
+
+def test_failed_report_is_left_out_of_difference_report(scanner, monkeypatch):
+    """Test that a task whose background report write fails is dropped from the diff."""
+    written = []
+    compared = []
+
+    def write_reports(task_name, *args):
+        if task_name == "broken":
+            raise OSError("disk full")
+        written.append(task_name)
+        return None
+
+    monkeypatch.setattr(scanner.task_validator, 'write_reports', write_reports)
+    monkeypatch.setattr(scanner, '_generate_difference_report',
+                        lambda task_names, format_type: compared.append(task_names))
+
+    tasks = [ScanTask(name=name, data_path=[]) for name in ("base", "broken", "extra")]
+    success = scanner.execute_scan(tasks, [Path("test_mission")])
+
+    assert success is False
+    assert written == ["base", "extra"]
+    assert compared == [["base", "extra"]]
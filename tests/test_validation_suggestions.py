@@ -74,3 +74,70 @@ def test_validation_result_adapter(validator):
     assert 'test_class' in adapter.class_suggestions
     assert adapter.class_suggestions['test_class'][0][0] == 'suggested_class'
     assert adapter.class_suggestions['test_class'][0][1] == 0.8
+
+def test_suggestion_cap(validator, sample_game_content, caplog, monkeypatch):
+    # Cap the fuzzy search at two missing classes per mission
+    validator.fuzzy_matcher.config.max_suggestions_total = 2
+    searched = []
+    find_batch = validator.fuzzy_matcher.find_similar_classes_batch
+
+    def recording_batch(queries, candidates, *args, **kwargs):
+        searched.append(list(queries))
+        return find_batch(queries, candidates, *args, **kwargs)
+
+    monkeypatch.setattr(validator.fuzzy_matcher, 'find_similar_classes_batch', recording_batch)
+
+    result = MockScanResult()
+    result.add_equipment(['zulu_missing', 'alpha_missing', 'mike_missing', 'existing_class'])
+
+    with caplog.at_level('WARNING'):
+        results = validator.validate_content(
+            {Path('capped_mission'): result},
+            sample_game_content,
+            {'classes': {}, 'assets': {}}
+        )
+
+    mission_result = results[Path('capped_mission')]
+    # Every missing class is still reported, only the search is capped
+    assert mission_result.missing_classes == {'zulu_missing', 'alpha_missing', 'mike_missing'}
+    # The first names in sorted order are searched
+    assert searched == [['alpha_missing', 'mike_missing']]
+    assert "3 missing classes, only generating suggestions for the first 2" in caplog.text
+
+def test_equipment_cache_bound_to_mission_results(validator, sample_mission_result, sample_game_content):
+    task_content = {'classes': {}, 'assets': {}}
+    validator.validate_content(sample_mission_result, sample_game_content, task_content)
+    validator.validate_content(sample_mission_result, sample_game_content, task_content)
+    assert len(validator._equipment_lower) == 1
+
+    # A new set of mission results drops the lookups of the previous one
+    other = MockScanResult()
+    other.add_equipment(['existing_class'])
+    validator.validate_content({Path('other_mission'): other}, sample_game_content, task_content)
+    cached = list(validator._equipment_lower.values())
+    assert len(cached) == 1 and cached[0][0] is other.equipment
+
+def test_game_candidates_prepared_once_across_tasks(validator, sample_mission_result, sample_game_content, monkeypatch):
+    from collections import ChainMap
+    game_lower = {k.lower(): k for k in sample_game_content['classes']}
+    prepared = []
+    prepare_candidate = validator.fuzzy_matcher._prepare_candidate
+
+    def recording_prepare(name):
+        prepared.append(name)
+        return prepare_candidate(name)
+
+    monkeypatch.setattr(validator.fuzzy_matcher, '_prepare_candidate', recording_prepare)
+
+    for task_class in ('task_one_class', 'task_two_class'):
+        task_content = {'classes': {task_class: {}}, 'assets': {}}
+        results = validator.validate_content(
+            sample_mission_result,
+            sample_game_content,
+            task_content,
+            content_classes_lower=ChainMap({task_class: task_class}, game_lower)
+        )
+        assert results is not None
+
+    # Game classes are normalized for the first task only, later tasks add their own names
+    assert sorted(prepared) == sorted(list(game_lower) + ['task_one_class', 'task_two_class'])